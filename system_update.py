@@ -18,16 +18,25 @@ Features:
 """
 
 import argparse
+import asyncio
+import atexit
+import configparser
 import csv
+import functools
+import itertools
 import json
 import logging
+import operator
 import os
 import platform
 import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
+import urllib.error
+import urllib.request
 
 # Force UTF-8 encoding for standard output to avoid UnicodeEncodeError on Windows
 if sys.stdout.encoding != 'utf-8':
@@ -36,12 +45,48 @@ if sys.stdout.encoding != 'utf-8':
     except AttributeError:
         pass
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Iterable, List, Dict, Mapping, Optional, Tuple
 from enum import Enum
+from logging.handlers import RotatingFileHandler
+
+# Optional faster JSON backend; the standard library is used when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional PEP 440 comparison for the PyPI update check; without it the
+# check falls back to `pip list --outdated`
+try:
+    from packaging.specifiers import InvalidSpecifier, SpecifierSet
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Version = None
+
+# Optional pooled HTTP client; plain urllib.request is used when missing
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Keep probed tools from flashing a console window on Windows; built once and
+# shared by every subprocess call
+if _IS_WINDOWS:
+    _SUBPROCESS_KWARGS = {
+        "startupinfo": subprocess.STARTUPINFO(
+            dwFlags=subprocess.STARTF_USESHOWWINDOW, wShowWindow=0
+        ),
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+    }
+else:
+    _SUBPROCESS_KWARGS = {}
 
 # Required rich imports - ensure_dependencies() will install if missing
 from rich import print
@@ -115,6 +160,10 @@ console = Console()
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+# __slots__ dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class UpdateStatus(Enum):
     """Package update status enumeration."""
 
@@ -126,7 +175,12 @@ class UpdateStatus(Enum):
     SECURITY_UPDATE_AVAILABLE = "🔒"
 
 
-@dataclass
+# Module-level aliases for the statuses the checkers assign in their loops
+_UPDATE_AVAILABLE = UpdateStatus.UPDATE_AVAILABLE
+_UP_TO_DATE = UpdateStatus.UP_TO_DATE
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AppInfo:
     """Structured application metadata."""
 
@@ -138,7 +192,14 @@ class AppInfo:
     update_status: UpdateStatus = UpdateStatus.UNKNOWN
     error_msg: Optional[str] = None
     install_path: Optional[str] = None
-    scan_time: datetime = field(default_factory=datetime.now)
+    scan_time: Optional[datetime] = None
+    # Case-folded lookup keys, computed once instead of per comparison
+    _name_ci: str = field(init=False, repr=False, compare=False)
+    _source_ci: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._name_ci = self.name.lower()
+        self._source_ci = self.source.lower()
 
     @property
     def has_update(self) -> bool:
@@ -151,13 +212,20 @@ class AppInfo:
 
     def to_dict(self) -> Dict:
         data = asdict(self)
+        del data["_name_ci"], data["_source_ci"]
         data["update_status"] = self.update_status.value
-        data["scan_time"] = self.scan_time.isoformat()
+        data["scan_time"] = self.scan_time.isoformat() if self.scan_time else None
         data["has_update"] = self.has_update
         return data
 
 
-@dataclass
+def finalize_scan_times(apps: List[AppInfo], ts: datetime):
+    """Stamp a whole scanner result with one scan time."""
+    for app in apps:
+        app.scan_time = ts
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SecurityInfo:
     """Security vulnerability metadata."""
 
@@ -238,15 +306,20 @@ class SystemConfig:
                     loaded_settings = json.load(f)
                     self._merge_settings(self.settings, loaded_settings)
             except Exception as e:
-                logging.warning(f"Failed to load config: {e}")
+                logging.warning("Failed to load config: %s", e)
 
     def _merge_settings(self, base: dict, loaded: dict):
-        """Recursively merge settings."""
-        for key, value in loaded.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_settings(base[key], value)
-            else:
-                base[key] = value
+        """Merge settings, descending into nested sections without recursion."""
+        stack = [(base, loaded)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                # JSON objects always decode to plain dicts
+                if type(value) is dict and type(current) is dict:
+                    stack.append((current, value))
+                else:
+                    target[key] = value
 
     def save(self):
         """Save current configuration to file."""
@@ -254,26 +327,69 @@ class SystemConfig:
             with open(self.config_file, "w", encoding="utf-8") as f:
                 json.dump(self.settings, f, indent=2, default=str)
         except Exception as e:
-            logging.error(f"Failed to save config: {e}")
+            logging.error("Failed to save config: %s", e)
 
 
 config = SystemConfig()
+# Size-bounded log that is only opened once something is written; debug
+# records are enabled on demand by enable_verbose_logging()
+_log_handler = RotatingFileHandler(
+    config.log_file,
+    maxBytes=1_000_000,
+    backupCount=3,
+    encoding="utf-8",
+    delay=True,
+)
+_log_handler.setLevel(logging.WARNING)
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.WARNING,
     format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(config.log_file),
-        logging.NullHandler(),
-    ],
+    handlers=[_log_handler],
 )
 logger = logging.getLogger(__name__)
 
 
+def enable_verbose_logging():
+    """Record debug details (e.g. failed commands) in the log file."""
+    logging.getLogger().setLevel(logging.DEBUG)
+    _log_handler.setLevel(logging.DEBUG)
+
+
+# Persistent worker pools shared by every scan and update check.
+# EXECUTOR runs whole per-source jobs, which may fan out further work into
+# COMMAND_EXECUTOR. Leaf jobs (a single subprocess or HTTP request each) must
+# never wait on other jobs from the same pool.
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=config.settings["performance"]["max_workers"],
+    thread_name_prefix="sysupd",
+)
+COMMAND_EXECUTOR = ThreadPoolExecutor(
+    max_workers=config.settings["performance"]["max_workers"],
+    thread_name_prefix="sysupd-cmd",
+)
+atexit.register(EXECUTOR.shutdown)
+atexit.register(COMMAND_EXECUTOR.shutdown)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CACHE MANAGEMENT
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+# AppInfo fields persisted by CacheManager, stored column-wise
+_CACHE_COLUMNS = (
+    "name",
+    "source",
+    "version",
+    "latest_version",
+    "app_id",
+    "update_status",
+    "error_msg",
+    "install_path",
+    "scan_time",
+)
+
+
 class CacheManager:
     """Intelligent caching system with validation."""
 
@@ -282,48 +398,77 @@ class CacheManager:
         self.duration = timedelta(hours=duration_hours)
 
     def is_valid(self) -> bool:
-        """Check if cache is valid and not expired."""
-        if not self.cache_file.exists():
-            return False
+        """Check if cache is valid and not expired.
+
+        Freshness comes from the file's mtime, so the cache does not have to
+        be read and parsed just to be rejected; save() replaces the whole file,
+        so the mtime matches the embedded timestamp.
+        """
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                cache_time = datetime.fromisoformat(data.get("timestamp", ""))
-                return datetime.now() - cache_time < self.duration
-        except Exception:
+            age = time.time() - self.cache_file.stat().st_mtime
+        except OSError:
             return False
+        return age < self.duration.total_seconds()
 
     def load(self) -> Optional[List[AppInfo]]:
         """Load cached applications with type safety."""
         if not self.is_valid():
             return None
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                apps = []
-                for item in data.get("apps", []):
-                    item.pop("has_update", None)
-                    item["update_status"] = UpdateStatus(item["update_status"])
-                    item["scan_time"] = datetime.fromisoformat(item["scan_time"])
-                    apps.append(AppInfo(**item))
-                return apps
+            data = _json_loads(self.cache_file.read_bytes())
+            columns = data.get("columns")
+            if columns is None:
+                return None
+
+            columns["update_status"] = [
+                UpdateStatus(value) for value in columns["update_status"]
+            ]
+            columns["scan_time"] = [
+                datetime.fromisoformat(value) if value else None
+                for value in columns["scan_time"]
+            ]
+            rows = zip(*(columns[column] for column in _CACHE_COLUMNS))
+            return [AppInfo(**dict(zip(_CACHE_COLUMNS, row))) for row in rows]
         except Exception as e:
-            logger.warning(f"Failed to load cache: {e}")
+            logger.warning("Failed to load cache: %s", e)
             return None
 
     def save(self, apps: List[AppInfo]):
-        """Save applications to cache with metadata."""
+        """Save applications to cache with metadata, one column at a time."""
+        # Write to a sibling file and swap it in, so a crash never leaves a
+        # truncated cache behind
+        tmp_file = self.cache_file.with_suffix(".tmp")
         try:
-            data = {
+            header = {
                 "timestamp": datetime.now().isoformat(),
                 "version": "5.0.0",
                 "total_apps": len(apps),
-                "apps": [app.to_dict() for app in apps],
             }
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with open(tmp_file, "wb", buffering=1 << 20) as f:
+                # Stream the object by hand so only one column is held in memory
+                f.write(_json_dumps(header)[:-1])
+                f.write(b',"columns":{')
+                for i, column in enumerate(_CACHE_COLUMNS):
+                    if i:
+                        f.write(b",")
+                    f.write(_json_dumps(column))
+                    f.write(b":")
+                    f.write(_json_dumps(self._column_values(apps, column)))
+                f.write(b"}}")
+            os.replace(tmp_file, self.cache_file)
         except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
+            logger.error("Failed to save cache: %s", e)
+            tmp_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _column_values(apps: List[AppInfo], column: str) -> list:
+        """Collect one cache column in its JSON-ready form."""
+        values = [getattr(app, column) for app in apps]
+        if column == "update_status":
+            return [status.value for status in values]
+        if column == "scan_time":
+            return [scan_time.isoformat() if scan_time else None for scan_time in values]
+        return values
 
     def clear(self):
         """Clear cache file."""
@@ -336,11 +481,32 @@ class CacheManager:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, default=str)
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_executable(name: str) -> Optional[str]:
+    """Resolve a command name against PATH/PATHEXT once per process."""
+    return shutil.which(name)
+
+
 def run_command(cmd: List[str], timeout: int = 45, allow_failure: bool = False, include_stderr: bool = False) -> Optional[str]:
     """Execute command with enhanced error handling and timeout."""
     try:
-        if platform.system() == "Windows":
-            executable = shutil.which(cmd[0])
+        if _IS_WINDOWS:
+            executable = _resolve_executable(cmd[0])
             if executable:
                 cmd[0] = executable
 
@@ -352,21 +518,192 @@ def run_command(cmd: List[str], timeout: int = 45, allow_failure: bool = False,
             encoding="utf-8",
             errors="ignore",
             timeout=timeout,
+            shell=False,
+            **_SUBPROCESS_KWARGS,
+        )
+        return _command_output(
+            cmd, result.returncode, result.stdout, result.stderr,
+            allow_failure, include_stderr,
         )
-        if result.returncode != 0 and not allow_failure:
-            logger.debug(f"Command exited {result.returncode}: {' '.join(cmd)}")
-            return None
-        # Mirror JS: combine stdout+stderr when include_stderr is requested
-        if include_stderr:
-            combined = f"{result.stdout}\n{result.stderr}".strip()
-            return combined or None
-        return result.stdout.strip() or None
     except subprocess.TimeoutExpired:
-        logger.warning(f"Command timed out: {' '.join(cmd)}")
+        logger.warning("Command timed out: %s", cmd)
         return None
     except FileNotFoundError as e:
-        logger.debug(f"Command not found: {' '.join(cmd)} - {e}")
+        logger.debug("Command not found: %s - %s", cmd, e)
+        return None
+
+
+async def run_command_async(cmd: List[str], timeout: int = 45, allow_failure: bool = False, include_stderr: bool = False) -> Optional[str]:
+    """Execute command on the running event loop; same contract as run_command."""
+    try:
+        if _IS_WINDOWS:
+            executable = _resolve_executable(cmd[0])
+            if executable:
+                cmd[0] = executable
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **_SUBPROCESS_KWARGS,
+        )
+    except FileNotFoundError as e:
+        logger.debug("Command not found: %s - %s", cmd, e)
+        return None
+
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        logger.warning("Command timed out: %s", cmd)
+        return None
+
+    return _command_output(
+        cmd, proc.returncode, _decode_output(stdout), _decode_output(stderr),
+        allow_failure, include_stderr,
+    )
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode raw process output the way text-mode subprocess.run does."""
+    text = data.decode("utf-8", errors="ignore")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _command_output(cmd: List[str], returncode: int, stdout: str, stderr: str, allow_failure: bool, include_stderr: bool) -> Optional[str]:
+    """Apply the shared exit-code and output rules to a finished command."""
+    if returncode != 0 and not allow_failure:
+        logger.debug("Command exited %d: %s", returncode, cmd)
         return None
+    # Mirror JS: combine stdout+stderr when include_stderr is requested
+    if include_stderr:
+        combined = f"{stdout}\n{stderr}".strip()
+        return combined or None
+    return stdout.strip() or None
+
+
+# Keep-alive connections shared by every HTTP lookup, so the GitHub, PyPI and
+# npm registry hosts each pay for one TLS handshake per run
+if urllib3 is not None:
+    _HTTP_POOL = urllib3.PoolManager(
+        num_pools=4,
+        maxsize=config.settings["performance"]["max_workers"],
+        headers={"User-Agent": "SystemUpdateCLI"},
+        retries=urllib3.Retry(connect=0, read=0, redirect=5),
+    )
+else:
+    _HTTP_POOL = None
+
+
+def _http_get(
+    url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 10
+) -> Optional[Tuple[int, Mapping[str, str], bytes]]:
+    """GET a URL and return (status, headers, body); None on network errors."""
+    # Per-request headers replace the pool defaults, so always merge them in
+    headers = {"User-Agent": "SystemUpdateCLI", **(headers or {})}
+    if _HTTP_POOL is not None:
+        try:
+            response = _HTTP_POOL.request("GET", url, headers=headers, timeout=timeout)
+            return response.status, response.headers, response.data
+        except Exception as e:
+            logger.debug("HTTP request failed: %s - %s", url, e)
+            return None
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        # Non-2xx answers (including 304 Not Modified) still carry headers
+        return e.code, e.headers, b""
+    except Exception as e:
+        logger.debug("HTTP request failed: %s - %s", url, e)
+        return None
+
+
+def fetch_json(url: str) -> Optional[dict]:
+    """Fetch and decode a JSON document; None on any failure."""
+    result = _http_get(url)
+    if result is None or result[0] != 200:
+        return None
+    try:
+        return _json_loads(result[2])
+    except ValueError:
+        return None
+
+
+def fetch_github_release(repo: str, max_age: int = 3600) -> Optional[dict]:
+    """Fetch the latest release of an owner/name GitHub repo through a disk cache.
+
+    Entries younger than max_age seconds are returned without any request;
+    older ones are revalidated with If-None-Match/If-Modified-Since, so an
+    unchanged release costs a bodiless 304.
+    """
+    cache_file = config.config_dir / "github" / f"{repo.replace('/', '_')}.json"
+    try:
+        cached = _json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        cached = None
+
+    if cached and time.time() - cached.get("fetched_at", 0) < max_age:
+        return cached.get("body")
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    result = _http_get(f"https://api.github.com/repos/{repo}/releases/latest", headers)
+    if result is None:
+        # Offline: a stale answer beats none
+        return cached.get("body") if cached else None
+
+    status, response_headers, body = result
+    if status == 304 and cached:
+        entry = cached
+    elif status == 200:
+        try:
+            entry = {
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+                "body": _json_loads(body),
+            }
+        except ValueError:
+            return None
+    else:
+        # Errors such as a 403/429 rate limit: fall back to the stale entry
+        return cached.get("body") if cached else None
+
+    entry["fetched_at"] = time.time()
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        cache_file.write_bytes(_json_dumps(entry))
+    except OSError as e:
+        logger.debug("Failed to cache GitHub release %s: %s", repo, e)
+    return entry["body"]
+
+
+def _split_table(output: str, *columns: str) -> Tuple[Optional[str], Iterable[str]]:
+    """Find the header of a column-aligned table and return it with the body rows.
+
+    Lines before the header (spinners, banners) and the separator line after
+    it are skipped; the header is None when no line contains all of the given
+    column names.
+    """
+    lines = output.splitlines()
+    for i, line in enumerate(lines):
+        if all(column in line for column in columns):
+            return line, itertools.islice(lines, i + 2, None)
+    return None, ()
+
+
+def submit_all(
+    fns: Iterable[Callable[[], object]], executor: ThreadPoolExecutor = EXECUTOR
+) -> List[Future]:
+    """Submit zero-argument callables to a shared pool, preserving order."""
+    return [executor.submit(fn) for fn in fns]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -374,6 +711,10 @@ def run_command(cmd: List[str], timeout: int = 45, allow_failure: bool = False,
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+_STYLE_UP_TO_DATE = Style(color="green")
+_STYLE_NEEDS_ATTENTION = Style(color="yellow")
+
+
 class UISystem:
     """Enhanced user interface system with beautiful layouts."""
 
@@ -469,16 +810,24 @@ class UISystem:
         table.add_column("🎯 Latest", style="green")
         table.add_column("📊 Status", justify="center")
 
-        for app in sorted(apps, key=lambda x: (x.source, x.name)):
-            status_style = (
-                "green" if app.update_status == UpdateStatus.UP_TO_DATE else "yellow"
-            )
+        # One pre-styled cell per status; avoids markup parsing on every row
+        status_cells: Dict[UpdateStatus, Text] = {}
+        for app in sorted(apps, key=operator.attrgetter("source", "name")):
+            status_cell = status_cells.get(app.update_status)
+            if status_cell is None:
+                status_style = (
+                    _STYLE_UP_TO_DATE
+                    if app.update_status is UpdateStatus.UP_TO_DATE
+                    else _STYLE_NEEDS_ATTENTION
+                )
+                status_cell = Text(app.status_display, style=status_style)
+                status_cells[app.update_status] = status_cell
             table.add_row(
                 app.name[:30],
                 app.source,
                 app.version,
                 app.latest_version or "N/A",
-                f"[{status_style}]{app.status_display}[/{status_style}]",
+                status_cell,
             )
 
         return table
@@ -521,6 +870,26 @@ class UISystem:
 # PACKAGE SCANNERS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Uninstall-key query used by the Registry scan
+_REGISTRY_PS_QUERY = """
+        $paths = @(
+            'HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*',
+            'HKCU:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*',
+            'HKLM:\\SOFTWARE\\Wow6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*'
+        )
+        Get-ItemProperty -Path $paths -ErrorAction SilentlyContinue | 
+            Where-Object { $_.DisplayName -and $_.DisplayVersion -and !$_.SystemComponent } | 
+            Select-Object @{n='Name';e={$_.DisplayName}}, 
+                         @{n='Version';e={$_.DisplayVersion}}, 
+                         @{n='InstallLocation';e={$_.InstallLocation}}"""
+
+_BUN_RE = re.compile(r"^\s*([^\s@]+)@(\S+)")
+_YARN_RE = re.compile(r'^info "([^@]+)@([^"]+)"')
+_DIGITS = frozenset("0123456789")
+# First dotted version (e.g. 2.43.0.windows.1) plus one optional suffix run
+# such as -beta.1+build.5; the rest of the line is not swallowed
+_VERSION_RE = re.compile(r"[0-9]+(?:\.[0-9]+)+(?:[-+.][0-9A-Za-z.+-]+)?")
+
 
 class PackageScanner:
     """Enhanced package scanning system."""
@@ -528,82 +897,76 @@ class PackageScanner:
     @staticmethod
     def scan_winget() -> List[AppInfo]:
         """Scan Winget packages with improved parsing."""
-        apps = []
         output = run_command(["winget", "list", "--accept-source-agreements"])
-        if not output:
-            return apps
-
-        lines = output.splitlines()
-        header_index = next(
-            (
-                i
-                for i, line in enumerate(lines)
-                if "Name" in line and "Id" in line and "Version" in line
-            ),
-            -1,
-        )
+        return PackageScanner._parse_winget_list(output) if output else []
 
-        if header_index == -1:
+    @staticmethod
+    def _parse_winget_list(output: str) -> List[AppInfo]:
+        """Parse the table printed by `winget list`."""
+        apps = []
+        header, rows = _split_table(output, "Name", "Id", "Version")
+        if header is None:
             return apps
 
-        header = lines[header_index]
-        positions = {
-            "name": 0,
-            "id": header.find("Id"),
-            "version": header.find("Version"),
-            "available": header.find("Available"),
-            "source": header.find("Source"),
-        }
+        id_pos = header.find("Id")
+        version_pos = header.find("Version")
+        available_pos = header.find("Available")
+        source_pos = header.find("Source")
+        version_end = (
+            available_pos
+            if available_pos != -1
+            else source_pos
+            if source_pos != -1
+            else None
+        )
+        name_slice = slice(0, id_pos)
+        id_slice = slice(id_pos, version_pos)
+        version_slice = slice(version_pos, version_end)
 
-        for line in lines[header_index + 2 :]:
-            if not line.strip() or line.startswith("-"):
+        for line in rows:
+            if len(line) < version_pos or line.startswith("-"):
                 continue
 
-            try:
-                name = line[positions["name"] : positions["id"]].strip()
-                app_id = line[positions["id"] : positions["version"]].strip()
-                version_start = positions["version"]
-                version_end = (
-                    positions["available"]
-                    if positions["available"] != -1
-                    else positions["source"]
-                    if positions["source"] != -1
-                    else len(line)
-                )
-                version = line[version_start:version_end].strip()
+            name = line[name_slice].strip()
+            app_id = line[id_slice].strip()
+            version = line[version_slice].strip()
 
-                if name and app_id and version:
-                    apps.append(
-                        AppInfo(
-                            name=name,
-                            source="Winget",
-                            version=version,
-                            app_id=app_id,
-                            update_status=UpdateStatus.UNKNOWN,
-                        )
+            if name and app_id and version:
+                apps.append(
+                    AppInfo(
+                        name=name,
+                        source="Winget",
+                        version=version,
+                        app_id=app_id,
+                        update_status=UpdateStatus.UNKNOWN,
                     )
-            except Exception:
-                continue
+                )
 
         return apps
 
     @staticmethod
     def scan_chocolatey() -> List[AppInfo]:
         """Scan Chocolatey packages."""
-        apps = []
         output = run_command(["choco", "list", "--local-only", "--limit-output"])
-        if not output:
-            return apps
+        return PackageScanner._parse_choco_list(output) if output else []
 
+    @staticmethod
+    def _parse_choco_list(output: str) -> List[AppInfo]:
+        """Parse `choco list --limit-output` name|version lines."""
+        apps = []
         for line in output.splitlines():
-            parts = [p.strip() for p in line.split("|") if p.strip()]
-            if len(parts) >= 2:
+            name, sep, rest = line.partition("|")
+            if not sep:
+                continue
+            name = name.strip()
+            version = rest.partition("|")[0].strip()
+            if name and version:
                 apps.append(
                     AppInfo(
-                        name=parts[0],
+                        name=name,
                         source="Chocolatey",
-                        version=parts[1],
-                        app_id=parts[0],
+                        version=version,
+                        app_id=name,
                     )
                 )
 
@@ -618,7 +981,7 @@ class PackageScanner:
             return apps
 
         try:
-            data = json.loads(output)
+            data = _json_loads(output)
             if "dependencies" in data:
                 for name, details in data["dependencies"].items():
                     apps.append(
@@ -643,7 +1006,7 @@ class PackageScanner:
             return apps
 
         try:
-            data = json.loads(output)
+            data = _json_loads(output)
             data = data[0] if isinstance(data, list) and data else data
 
             if isinstance(data, dict) and "dependencies" in data:
@@ -670,7 +1033,7 @@ class PackageScanner:
             return apps
 
         for line in output.splitlines():
-            match = re.match(r"^\s*([^\s@]+)@([^\s]+)", line)
+            match = _BUN_RE.match(line)
             if match:
                 apps.append(
                     AppInfo(
@@ -692,7 +1055,7 @@ class PackageScanner:
             return apps
 
         for line in output.splitlines():
-            match = re.match(r'^info "([^@]+)@([^"]+)"', line)
+            match = _YARN_RE.match(line)
             if match:
                 apps.append(
                     AppInfo(
@@ -714,7 +1077,7 @@ class PackageScanner:
             return apps
 
         try:
-            data = json.loads(output)
+            data = _json_loads(output)
             for item in data:
                 apps.append(
                     AppInfo(
@@ -750,71 +1113,82 @@ class PackageScanner:
             "pwsh",
         ]
 
-        for exe in executables:
-            cmd = ["where", exe] if platform.system() == "Windows" else ["which", exe]
-            path = run_command(cmd)
-            if path:
-                version_output = run_command([exe, "--version"])
-                if version_output:
-                    match = re.search(r"(\d+\.\d+(\.\d+)*([-.].*)?)", version_output)
-                    if match:
-                        apps.append(
-                            AppInfo(
-                                name=exe,
-                                source="PATH",
-                                version=match.group(0),
-                                install_path=path.split("\n")[0],
-                            )
-                        )
+        probes = asyncio.run(PackageScanner._probe_executables(executables))
+        for exe, probe in zip(executables, probes):
+            if not probe:
+                continue
+            path, version_output = probe
+            match = _VERSION_RE.search(version_output)
+            if match:
+                apps.append(
+                    AppInfo(
+                        name=exe,
+                        source="PATH",
+                        version=match.group(0),
+                        install_path=path.split("\n")[0],
+                    )
+                )
 
         return apps
 
+    @staticmethod
+    async def _probe_executables(
+        executables: List[str],
+    ) -> List[Optional[Tuple[str, str]]]:
+        """Probe all executables concurrently on a single event loop."""
+        return await asyncio.gather(
+            *(PackageScanner._probe_executable(exe) for exe in executables)
+        )
+
+    @staticmethod
+    async def _probe_executable(exe: str) -> Optional[Tuple[str, str]]:
+        """Resolve an executable on PATH and capture its version output."""
+        cmd = ["where", exe] if _IS_WINDOWS else ["which", exe]
+        path = await run_command_async(cmd)
+        if not path:
+            return None
+        version_output = await run_command_async([exe, "--version"])
+        if not version_output:
+            return None
+        return path, version_output
+
     @staticmethod
     def scan_registry() -> List[AppInfo]:
         """Scan Windows Registry for installed applications."""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             return []
 
-        apps = []
-        ps_script = """
-        $paths = @(
-            'HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*',
-            'HKCU:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*',
-            'HKLM:\\SOFTWARE\\Wow6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*'
+        output = run_command(
+            ["powershell", "-NoProfile", "-Command", f"{_REGISTRY_PS_QUERY} | ConvertTo-Json"]
         )
-        Get-ItemProperty -Path $paths -ErrorAction SilentlyContinue | 
-            Where-Object { $_.DisplayName -and $_.DisplayVersion -and !$_.SystemComponent } | 
-            Select-Object @{n='Name';e={$_.DisplayName}}, 
-                         @{n='Version';e={$_.DisplayVersion}}, 
-                         @{n='InstallLocation';e={$_.InstallLocation}} | 
-            ConvertTo-Json
-        """
-
-        output = run_command(["powershell", "-NoProfile", "-Command", ps_script])
-        if output:
-            try:
-                data = json.loads(output)
-                data = [data] if isinstance(data, dict) else data
-                for item in data:
-                    apps.append(
-                        AppInfo(
-                            name=item["Name"],
-                            source="Registry",
-                            version=item["Version"],
-                            install_path=item.get("InstallLocation"),
-                        )
-                    )
-            except Exception:
-                pass
+        if not output:
+            return []
+        try:
+            return PackageScanner._parse_registry(_json_loads(output))
+        except ValueError:
+            return []
 
-        # Remove duplicates
-        unique_apps = {}
-        for app in apps:
-            key = f"{app.name}|{app.version}"
-            if key not in unique_apps:
-                unique_apps[key] = app
+    @staticmethod
+    def _parse_registry(data) -> List[AppInfo]:
+        """Build deduplicated Registry apps from the PowerShell JSON result."""
+        unique_apps: Dict[str, AppInfo] = {}
+        data = [data] if isinstance(data, dict) else data
+        try:
+            for item in data:
+                # Skip duplicates before allocating an AppInfo
+                key = f"{item['Name']}|{item['Version']}"
+                if key in unique_apps:
+                    continue
+                unique_apps[key] = AppInfo(
+                    name=item["Name"],
+                    source="Registry",
+                    version=item["Version"],
+                    install_path=item.get("InstallLocation"),
+                )
+        except Exception:
+            pass
 
-        return sorted(unique_apps.values(), key=lambda x: x.name)
+        return sorted(unique_apps.values(), key=operator.attrgetter("name"))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -822,6 +1196,41 @@ class PackageScanner:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+# Sources whose checker covers every app, so apps it did not flag are current
+_CHECKED_SOURCES = frozenset(
+    {"Winget", "Chocolatey", "NPM", "PNPM", "Bun", "Yarn", "PIP", "Registry"}
+)
+
+# Version patterns used by the PATH tool probes
+_BUN_VER_RE = re.compile(r"Bun v([0-9.]+)\s+is out!")
+_DENO_VER_RE = re.compile(r"Found latest stable version\s+v?([0-9.]+)", re.IGNORECASE)
+_GENERIC_VER_RE = re.compile(r"v?([0-9.]+)")
+_GIT_VER_RE = re.compile(r"v?([0-9.]+?)(?:\.windows)")
+_WINGET_VER_RE = re.compile(r"Version:\s+([0-9.]+)")
+
+# `winget upgrade` output shared by the Winget and Registry checkers
+_WINGET_UPGRADE_TTL = 60
+_winget_upgrade_lock = threading.Lock()
+_winget_upgrade_cache: Optional[Tuple[float, Optional[str]]] = None
+
+# In-flight and finished `npm view` lookups, shared by the Bun and Yarn checkers
+_npm_version_lock = threading.Lock()
+_npm_version_futures: Dict[str, Future] = {}
+
+
+def _strip_leading_nondigits(version: str) -> str:
+    """Drop everything before the first digit, e.g. 'v1.2.3' -> '1.2.3'."""
+    # Common prefixes are plain characters; only fall back to scanning for
+    # anything more unusual
+    stripped = version.lstrip("vV ~^=<>")
+    if stripped and stripped[0] not in _DIGITS:
+        i = 0
+        while i < len(stripped) and stripped[i] not in _DIGITS:
+            i += 1
+        stripped = stripped[i:]
+    return stripped.strip()
+
+
 class UpdateChecker:
     """Enhanced update checking system."""
 
@@ -832,107 +1241,126 @@ class UpdateChecker:
         """Check updates for all supported package managers."""
         total_updates = 0
 
-        # Group apps by source for batch processing
-        sources = {
-            "Winget": [a for a in apps if a.source == "Winget"],
-            "Chocolatey": [a for a in apps if a.source == "Chocolatey"],
-            "NPM": [a for a in apps if a.source == "NPM"],
-            "PNPM": [a for a in apps if a.source == "PNPM"],
-            "Bun": [a for a in apps if a.source == "Bun"],
-            "Yarn": [a for a in apps if a.source == "Yarn"],
-            "PIP": [a for a in apps if a.source == "PIP"],
-            "PATH": [a for a in apps if a.source == "PATH"],
-            "Registry": [a for a in apps if a.source == "Registry"],
+        checkers = {
+            "Winget": UpdateChecker._check_winget_updates,
+            "Chocolatey": UpdateChecker._check_choco_updates,
+            "NPM": UpdateChecker._check_npm_updates,
+            "PNPM": UpdateChecker._check_pnpm_updates,
+            "Bun": UpdateChecker._check_bun_updates,
+            "Yarn": UpdateChecker._check_yarn_updates,
+            "PIP": UpdateChecker._check_pip_updates,
+            "PATH": UpdateChecker._check_path_updates,
+            "Registry": UpdateChecker._check_registry_updates,
         }
 
-        # Check updates for each source
-        for source_name, source_apps in sources.items():
-            if not source_apps:
-                continue
-
-            progress.update(task_id, description=f"Checking {source_name} updates...")
-
-            if source_name == "Winget":
-                total_updates += UpdateChecker._check_winget_updates(source_apps)
-            elif source_name == "Chocolatey":
-                total_updates += UpdateChecker._check_choco_updates(source_apps)
-            elif source_name == "NPM":
-                total_updates += UpdateChecker._check_npm_updates(source_apps)
-            elif source_name == "PNPM":
-                total_updates += UpdateChecker._check_pnpm_updates(source_apps)
-            elif source_name == "Bun":
-                total_updates += UpdateChecker._check_bun_updates(source_apps)
-            elif source_name == "Yarn":
-                total_updates += UpdateChecker._check_yarn_updates(source_apps)
-            elif source_name == "PIP":
-                total_updates += UpdateChecker._check_pip_updates(source_apps)
-            elif source_name == "PATH":
-                total_updates += UpdateChecker._check_path_updates(source_apps)
-            elif source_name == "Registry":
-                total_updates += UpdateChecker._check_registry_updates(source_apps)
-
-            progress.advance(task_id, 10)
-
-        # Mark apps with proper status (match JavaScript logic)
+        # Group apps by source for batch processing in a single pass
+        sources = defaultdict(list)
         for app in apps:
-            if app.update_status == UpdateStatus.UPDATE_AVAILABLE:
-                continue
-            if app.update_status == UpdateStatus.UP_TO_DATE:
-                continue
-            # Sources that perform update checks should be marked UP_TO_DATE if no update found
-            # PATH is checked individually so only mark UP_TO_DATE if latest_version was set
-            if app.latest_version or app.source in ["Winget", "Chocolatey", "NPM", "PNPM", "Bun", "Yarn", "PIP", "Registry"]:
-                app.update_status = UpdateStatus.UP_TO_DATE
-            else:
-                app.update_status = UpdateStatus.UNKNOWN
+            sources[app.source].append(app)
+
+        # Sources are independent, so check them all concurrently
+        pending = [name for name in checkers if sources.get(name)]
+        futures = submit_all(
+            functools.partial(
+                UpdateChecker._run_checker, name, checkers[name], sources[name]
+            )
+            for name in pending
+        )
+        future_to_source = dict(zip(futures, pending))
+
+        # Progress is only touched from this thread, as each source finishes
+        remaining = list(pending)
+        step = 100 / len(pending) if pending else 0
+        if remaining:
+            progress.update(
+                task_id, description=f"Checking {', '.join(remaining)} updates..."
+            )
+        for future in as_completed(future_to_source):
+            source_name = future_to_source[future]
+            try:
+                total_updates += future.result()
+            except Exception as e:
+                logger.warning("%s update check failed: %s", source_name, e)
+            remaining.remove(source_name)
+            if remaining:
+                progress.update(
+                    task_id,
+                    description=f"Checking {', '.join(remaining)} updates...",
+                    advance=step,
+                )
 
         progress.update(task_id, description="Update checks complete", completed=100)
         return total_updates
 
+    @staticmethod
+    def _run_checker(
+        source_name: str, checker: Callable[[List[AppInfo]], int], apps: List[AppInfo]
+    ) -> int:
+        """Run one source checker and settle the status of the apps it covered."""
+        updates = checker(apps)
+        # Match JavaScript logic: apps without an update are UP_TO_DATE, except
+        # PATH tools, which set their own status only when a version was found
+        if source_name in _CHECKED_SOURCES:
+            for app in apps:
+                if app.update_status is UpdateStatus.UNKNOWN:
+                    app.update_status = _UP_TO_DATE
+        return updates
+
+    @staticmethod
+    def _winget_upgrade_output() -> Optional[str]:
+        """Return `winget upgrade` output, running it at most once per TTL."""
+        global _winget_upgrade_cache
+        # Holding the lock while winget runs makes a concurrent checker wait
+        # for this result instead of starting a second winget process
+        with _winget_upgrade_lock:
+            now = time.monotonic()
+            if (
+                _winget_upgrade_cache is None
+                or now - _winget_upgrade_cache[0] > _WINGET_UPGRADE_TTL
+            ):
+                output = run_command(
+                    ["winget", "upgrade", "--accept-source-agreements"],
+                    allow_failure=True,
+                )
+                _winget_upgrade_cache = (now, output)
+            return _winget_upgrade_cache[1]
+
     @staticmethod
     def _check_winget_updates(apps: List[AppInfo]) -> int:
         """Check Winget package updates."""
         updates = 0
-        output = run_command(["winget", "upgrade", "--accept-source-agreements"])
+        if not apps:
+            return updates
+        output = UpdateChecker._winget_upgrade_output()
         if not output:
             return updates
 
-        lines = output.splitlines()
-        header_index = next(
-            (i for i, line in enumerate(lines) if "Name" in line and "Id" in line), -1
-        )
-
-        if header_index == -1:
+        header, rows = _split_table(output, "Name", "Id")
+        if header is None:
             return updates
 
-        header = lines[header_index]
-        positions = {
-            "id": header.find("Id"),
-            "version": header.find("Version"),
-            "available": header.find("Available"),
-            "source": header.find("Source"),
-        }
+        # Column positions are fixed by the header; resolve them once
+        id_start = header.find("Id")
+        id_end = header.find("Version")
+        avail_start = header.find("Available")
+        source_start = header.find("Source")
+        if avail_start == -1:
+            return updates
+        avail_end = source_start if source_start != -1 else None
+        by_id = {app.app_id.lower(): app for app in apps if app.app_id}
 
-        for line in lines[header_index + 2 :]:
-            if not line.strip():
+        for line in rows:
+            if len(line) <= avail_start:
                 continue
 
-            try:
-                app_id = line[positions["id"] : positions["version"]].strip()
-                if positions["available"] != -1:
-                    avail_end = (
-                        positions["source"] if positions["source"] != -1 else len(line)
-                    )
-                    latest = line[positions["available"] : avail_end].strip()
-
-                    if app_id and latest:
-                        for app in apps:
-                            if app.app_id and app.app_id.lower() == app_id.lower():
-                                app.latest_version = latest
-                                app.update_status = UpdateStatus.UPDATE_AVAILABLE
-                                updates += 1
-            except Exception:
-                continue
+            app_id = line[id_start:id_end].strip()
+            latest = line[avail_start:avail_end].strip()
+            if app_id and latest:
+                app = by_id.get(app_id.lower())
+                if app:
+                    app.latest_version = latest
+                    app.update_status = _UPDATE_AVAILABLE
+                    updates += 1
 
         return updates
 
@@ -945,53 +1373,45 @@ class UpdateChecker:
         by name to detect available updates.
         """
         updates = 0
-        output = run_command(["winget", "upgrade", "--accept-source-agreements"], allow_failure=True)
+        if not apps:
+            return updates
+        output = UpdateChecker._winget_upgrade_output()
         if not output:
             # Mark all as UP_TO_DATE since we have no upgrade data
             for app in apps:
-                app.update_status = UpdateStatus.UP_TO_DATE
+                app.update_status = _UP_TO_DATE
             return updates
 
-        lines = output.splitlines()
-        header_index = next(
-            (i for i, line in enumerate(lines) if "Name" in line and "Id" in line), -1
-        )
-        if header_index == -1:
+        header, rows = _split_table(output, "Name", "Id")
+        if header is None:
             for app in apps:
-                app.update_status = UpdateStatus.UP_TO_DATE
+                app.update_status = _UP_TO_DATE
             return updates
 
-        header = lines[header_index]
-        positions = {
-            "id": header.find("Id"),
-            "version": header.find("Version"),
-            "available": header.find("Available"),
-            "source": header.find("Source"),
-        }
+        id_start = header.find("Id")
+        avail_start = header.find("Available")
+        source_start = header.find("Source")
+        avail_end = source_start if source_start != -1 else None
 
         # Build a lookup: lowercased name -> latest version
         upgrade_map: dict = {}
-        for line in lines[header_index + 2:]:
-            if not line.strip():
-                continue
-            try:
-                name = line[0:positions["id"]].strip().lower()
-                if positions["available"] != -1:
-                    avail_end = positions["source"] if positions["source"] != -1 else len(line)
-                    latest = line[positions["available"]:avail_end].strip()
-                    if name and latest:
-                        upgrade_map[name] = latest
-            except Exception:
-                continue
+        if avail_start != -1:
+            for line in rows:
+                if len(line) <= avail_start:
+                    continue
+                name = line[:id_start].strip().lower()
+                latest = line[avail_start:avail_end].strip()
+                if name and latest:
+                    upgrade_map[name] = latest
 
         for app in apps:
-            latest = upgrade_map.get(app.name.lower())
+            latest = upgrade_map.get(app._name_ci)
             if latest:
                 app.latest_version = latest
-                app.update_status = UpdateStatus.UPDATE_AVAILABLE
+                app.update_status = _UPDATE_AVAILABLE
                 updates += 1
             else:
-                app.update_status = UpdateStatus.UP_TO_DATE
+                app.update_status = _UP_TO_DATE
 
         return updates
 
@@ -1003,14 +1423,19 @@ class UpdateChecker:
         if not output:
             return updates
 
+        by_name = {app._name_ci: app for app in apps}
         for line in output.splitlines():
-            parts = line.split("|")
-            if len(parts) >= 3:
-                for app in apps:
-                    if app.name == parts[0]:
-                        app.latest_version = parts[2]
-                        app.update_status = UpdateStatus.UPDATE_AVAILABLE
-                        updates += 1
+            # name|current|available|pinned - only the first three are needed
+            name, _, rest = line.partition("|")
+            _current, _, rest = rest.partition("|")
+            latest, _, _ = rest.partition("|")
+            if not latest:
+                continue
+            app = by_name.get(name.lower())
+            if app:
+                app.latest_version = latest
+                app.update_status = _UPDATE_AVAILABLE
+                updates += 1
 
         return updates
 
@@ -1018,24 +1443,32 @@ class UpdateChecker:
     def _check_npm_updates(apps: List[AppInfo]) -> int:
         """Check NPM package updates."""
         updates = 0
+        outdated = UpdateChecker._npm_outdated_map()
+        for app in apps:
+            latest_version = outdated.get(app._name_ci)
+            if latest_version:
+                app.latest_version = latest_version
+                app.update_status = _UPDATE_AVAILABLE
+                updates += 1
+
+        return updates
+
+    @staticmethod
+    def _npm_outdated_map() -> Dict[str, str]:
+        """Map lower-cased name to latest version for all outdated global NPM packages."""
         output = run_command(["npm", "outdated", "-g", "--json"], allow_failure=True)
         if not output:
-            return updates
+            return {}
 
         try:
-            data = json.loads(output)
-            for name, details in data.items():
-                for app in apps:
-                    if app.name == name:
-                        latest_version = details.get("latest", "")
-                        if latest_version:
-                            app.latest_version = latest_version
-                            app.update_status = UpdateStatus.UPDATE_AVAILABLE
-                            updates += 1
+            data = _json_loads(output)
+            return {
+                name.lower(): details["latest"]
+                for name, details in data.items()
+                if details.get("latest")
+            }
         except Exception:
-            pass
-
-        return updates
+            return {}
 
     @staticmethod
     def _check_pnpm_updates(apps: List[AppInfo]) -> int:
@@ -1045,27 +1478,25 @@ class UpdateChecker:
         if not output:
             return updates
 
+        by_name = {app._name_ci: app for app in apps}
         try:
-            data = json.loads(output)
+            data = _json_loads(output)
+            # pnpm emits either {name: details} or [{name, ...details}]
             if isinstance(data, dict):
-                for name, details in data.items():
-                    for app in apps:
-                        if app.name == name:
-                            latest_version = details.get("latest", details.get("wanted", ""))
-                            if latest_version:
-                                app.latest_version = latest_version
-                                app.update_status = UpdateStatus.UPDATE_AVAILABLE
-                                updates += 1
+                entries = data.items()
             elif isinstance(data, list):
-                for item in data:
-                    name = item.get("name")
-                    for app in apps:
-                        if app.name == name:
-                            latest_version = item.get("latest", item.get("wanted", ""))
-                            if latest_version:
-                                app.latest_version = latest_version
-                                app.update_status = UpdateStatus.UPDATE_AVAILABLE
-                                updates += 1
+                entries = ((item.get("name"), item) for item in data)
+            else:
+                entries = ()
+
+            for name, details in entries:
+                app = by_name.get(name.lower()) if name else None
+                if app:
+                    latest_version = details.get("latest", details.get("wanted", ""))
+                    if latest_version:
+                        app.latest_version = latest_version
+                        app.update_status = _UPDATE_AVAILABLE
+                        updates += 1
         except Exception:
             pass
 
@@ -1075,129 +1506,281 @@ class UpdateChecker:
     def _check_pip_updates(apps: List[AppInfo]) -> int:
         """Check PIP package updates."""
         updates = 0
+        pending = apps
+        via_pypi = Version is not None and not UpdateChecker._pip_uses_custom_index()
+        if via_pypi:
+            updates, pending = UpdateChecker._check_pip_via_pypi(apps)
+            if not pending:
+                return updates
+
+        # pip resolves whatever PyPI could not answer for this interpreter
+        outdated = UpdateChecker._pip_outdated_map()
+        if outdated is None:
+            if via_pypi:
+                # Unresolved packages must not be reported as up to date
+                for app in pending:
+                    app.update_status = UpdateStatus.ERROR
+                    app.error_msg = "No version data from PyPI or pip"
+            return updates
+
+        for app in pending:
+            latest = outdated.get(app._name_ci)
+            if latest:
+                app.latest_version = latest
+                app.update_status = _UPDATE_AVAILABLE
+                updates += 1
+
+        return updates
+
+    @staticmethod
+    def _pip_uses_custom_index() -> bool:
+        """Whether pip is configured for an index other than PyPI."""
+        urls = [
+            os.environ.get("PIP_INDEX_URL", ""),
+            os.environ.get("PIP_EXTRA_INDEX_URL", ""),
+        ]
+
+        name = "pip.ini" if _IS_WINDOWS else "pip.conf"
+        home = Path.home()
+        candidates = [Path(sys.prefix) / name, home / ".pip" / name]
+        if os.environ.get("PIP_CONFIG_FILE"):
+            candidates.append(Path(os.environ["PIP_CONFIG_FILE"]))
+        if _IS_WINDOWS:
+            for var in ("APPDATA", "PROGRAMDATA"):
+                if os.environ.get(var):
+                    candidates.append(Path(os.environ[var]) / "pip" / name)
+            candidates.append(home / "pip" / name)
+        else:
+            config_home = os.environ.get("XDG_CONFIG_HOME") or home / ".config"
+            candidates += [
+                Path(config_home) / "pip" / name,
+                home / "Library" / "Application Support" / "pip" / name,
+                Path("/etc") / name,
+                Path("/etc/xdg/pip") / name,
+            ]
+
+        parser = configparser.ConfigParser(interpolation=None)
+        try:
+            parser.read(candidates, encoding="utf-8")
+        except configparser.Error as e:
+            logger.debug("Unreadable pip configuration: %s", e)
+            return True
+        for section in parser.sections():
+            for key in ("index-url", "extra-index-url", "index_url", "extra_index_url"):
+                urls.append(parser.get(section, key, fallback=""))
+
+        return any(
+            url and not url.startswith("https://pypi.org/")
+            for value in urls
+            for url in value.split()
+        )
+
+    @staticmethod
+    def _check_pip_via_pypi(apps: List[AppInfo]) -> Tuple[int, List[AppInfo]]:
+        """Compare installed PIP packages against the PyPI JSON API.
+
+        Versions come from the scan, so no pip subprocess is needed. Returns
+        the update count and the apps PyPI could not settle: failed lookups
+        and latest releases whose Requires-Python excludes this interpreter.
+        """
+        releases = UpdateChecker._pypi_latest_releases(app.name for app in apps)
+        python_version = platform.python_version()
+
+        updates = 0
+        unresolved = []
+        for app in apps:
+            info = releases.get(app.name)
+            latest = info.get("version") if info else None
+            if not latest or not UpdateChecker._supports_python(
+                info.get("requires_python"), python_version
+            ):
+                unresolved.append(app)
+                continue
+            try:
+                newer = Version(latest) > Version(app.version)
+            except InvalidVersion:
+                newer = latest != app.version
+            if newer:
+                app.latest_version = latest
+                app.update_status = _UPDATE_AVAILABLE
+                updates += 1
+
+        return updates, unresolved
+
+    @staticmethod
+    def _supports_python(requires_python: Optional[str], python_version: str) -> bool:
+        """Check a release's Requires-Python against the running interpreter."""
+        if not requires_python:
+            return True
+        try:
+            return SpecifierSet(requires_python).contains(
+                python_version, prereleases=True
+            )
+        except InvalidSpecifier:
+            return False
+
+    @staticmethod
+    def _pypi_latest_releases(names: Iterable[str]) -> Dict[str, dict]:
+        """Fetch the PyPI `info` block of each distinct package name."""
+        future_to_name = {
+            COMMAND_EXECUTOR.submit(fetch_json, f"https://pypi.org/pypi/{name}/json"): name
+            for name in set(names)
+        }
+        releases = {}
+        for future in as_completed(future_to_name):
+            data = future.result()
+            info = data.get("info") if data else None
+            if info:
+                releases[future_to_name[future]] = info
+        return releases
+
+    @staticmethod
+    def _pip_outdated_map() -> Optional[Dict[str, str]]:
+        """Map lower-cased name to latest version for all outdated PIP packages.
+
+        Returns None when pip produced no usable answer.
+        """
         output = run_command(
             [sys.executable, "-m", "pip", "list", "--outdated", "--format=json"],
             allow_failure=True,
         )
         if not output:
-            return updates
+            return None
 
         try:
-            data = json.loads(output)
-            for item in data:
-                name = item.get("name")
-                latest = item.get("latest_version")
-                for app in apps:
-                    if app.name == name:
-                        app.latest_version = latest
-                        app.update_status = UpdateStatus.UPDATE_AVAILABLE
-                        updates += 1
+            data = _json_loads(output)
+            return {
+                item["name"].lower(): item["latest_version"]
+                for item in data
+                if item.get("name") and item.get("latest_version")
+            }
         except Exception:
-            pass
-
-        return updates
+            return None
 
     @staticmethod
     def _check_bun_updates(apps: List[AppInfo]) -> int:
         """Check Bun package updates."""
-        updates = 0
-        for app in apps:
-            output = run_command(["npm", "info", app.name, "version"])
-            if output:
-                latest = output.strip()
-                if latest and latest != app.version and "ERR" not in latest:
-                    app.latest_version = latest
-                    app.update_status = UpdateStatus.UPDATE_AVAILABLE
-                    updates += 1
-        return updates
+        return UpdateChecker._check_via_npm_info(apps)
 
     @staticmethod
     def _check_yarn_updates(apps: List[AppInfo]) -> int:
         """Check Yarn package updates."""
+        return UpdateChecker._check_via_npm_info(apps)
+
+    @staticmethod
+    def _check_via_npm_info(apps: List[AppInfo]) -> int:
+        """Check packages against the latest versions published on the npm registry."""
         updates = 0
+        latest_versions = UpdateChecker._npm_latest_versions(app.name for app in apps)
         for app in apps:
-            output = run_command(["npm", "info", app.name, "version"])
-            if output:
-                latest = output.strip()
-                if latest and latest != app.version and "ERR" not in latest:
-                    app.latest_version = latest
-                    app.update_status = UpdateStatus.UPDATE_AVAILABLE
-                    updates += 1
+            latest = latest_versions.get(app.name)
+            if latest and latest != app.version:
+                app.latest_version = latest
+                app.update_status = _UPDATE_AVAILABLE
+                updates += 1
         return updates
 
+    @staticmethod
+    def _npm_latest_versions(names: Iterable[str]) -> Dict[str, str]:
+        """Resolve the latest npm registry version of each distinct package name.
+
+        `npm view` accepts a single package per call (extra arguments are read
+        as field names), so lookups are deduplicated and run in parallel. A
+        package already requested by another checker reuses that lookup.
+        """
+        future_to_name = {}
+        with _npm_version_lock:
+            for name in set(names):
+                future = _npm_version_futures.get(name)
+                if future is None:
+                    future = COMMAND_EXECUTOR.submit(
+                        run_command, ["npm", "view", name, "version"]
+                    )
+                    _npm_version_futures[name] = future
+                future_to_name[future] = name
+
+        latest_versions = {}
+        for future in as_completed(future_to_name):
+            output = future.result()
+            if output and "ERR" not in output:
+                latest_versions[future_to_name[future]] = output.strip()
+        return latest_versions
+
     @staticmethod
     def _check_path_updates(apps: List[AppInfo]) -> int:
         """Check PATH tool updates."""
-        import urllib.request
-        updates = 0
-
-        def fetch_json(url):
-            req = urllib.request.Request(url, headers={'User-Agent': 'SystemUpdateCLI'})
-            try:
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    return json.loads(response.read().decode())
-            except Exception:
-                return None
+        # Every tool is an independent subprocess or HTTP probe
+        futures = submit_all(
+            (functools.partial(UpdateChecker._probe_path_tool, app) for app in apps),
+            COMMAND_EXECUTOR,
+        )
+        return sum(future.result() for future in futures)
 
-        for app in apps:
-            latest = ""
-            try:
-                if app.name == "bun":
-                    output = run_command(["bun", "upgrade", "--dry-run"], allow_failure=True, include_stderr=True)
-                    if output:
-                        match = re.search(r"Bun v([0-9.]+)\s+is out!", output)
-                        if match:
-                            latest = match.group(1)
-                        else:
-                            latest = app.version
-                elif app.name == "deno":
-                    output = run_command(["deno", "upgrade", "--dry-run"], allow_failure=True, include_stderr=True)
-                    if output:
-                        match = re.search(r"Found latest stable version\s+v?([0-9.]+)", output, re.IGNORECASE)
-                        if match:
-                            latest = match.group(1)
-                        else:
-                            latest = app.version
-                elif app.name in ("yarn", "npm", "pnpm", "node"):
+    @staticmethod
+    def _probe_path_tool(app: AppInfo) -> int:
+        """Look up the latest version of one PATH tool; returns 1 if outdated."""
+        latest = ""
+        try:
+            if app.name == "bun":
+                output = run_command(["bun", "upgrade", "--dry-run"], allow_failure=True, include_stderr=True)
+                if output:
+                    match = _BUN_VER_RE.search(output)
+                    if match:
+                        latest = match.group(1)
+                    else:
+                        latest = app.version
+            elif app.name == "deno":
+                output = run_command(["deno", "upgrade", "--dry-run"], allow_failure=True, include_stderr=True)
+                if output:
+                    match = _DENO_VER_RE.search(output)
+                    if match:
+                        latest = match.group(1)
+                    else:
+                        latest = app.version
+            elif app.name in ("yarn", "npm", "pnpm", "node"):
+                # The registry answers directly; npm itself is only a fallback
+                data = fetch_json(f"https://registry.npmjs.org/{app.name}/latest")
+                if data and data.get("version"):
+                    latest = data["version"]
+                else:
                     output = run_command(["npm", "view", app.name, "version"])
                     if output and "ERR" not in output:
                         latest = output.strip()
-                elif app.name == "python":
-                    data = fetch_json("https://api.github.com/repos/python/cpython/releases/latest")
-                    if data and data.get("tag_name"):
-                        match = re.search(r"v?([0-9.]+)", data["tag_name"])
-                        if match:
-                            latest = match.group(1)
-                    if not latest:
-                        latest = app.version
-                elif app.name == "git":
-                    data = fetch_json("https://api.github.com/repos/git-for-windows/git/releases/latest")
-                    if data and data.get("tag_name"):
-                        match = re.search(r"v?([0-9.]+?)(?:\.windows)", data["tag_name"])
-                        latest = match.group(1) if match else data["tag_name"].replace("v", "")
-                elif app.name == "pwsh":
-                    data = fetch_json("https://api.github.com/repos/PowerShell/PowerShell/releases/latest")
-                    if data and data.get("tag_name"):
-                        latest = data["tag_name"].replace("v", "")
-                elif app.name == "dotnet":
-                    output = run_command(["winget", "show", "Microsoft.DotNet.SDK.9", "--accept-source-agreements"])
-                    if output:
-                        match = re.search(r"Version:\s+([0-9.]+)", output)
-                        if match:
-                            latest = match.group(1)
-
-                if latest:
-                    clean_version = re.sub(r'^[^\d]+', '', app.version).strip()
-                    clean_latest = re.sub(r'^[^\d]+', '', latest).strip()
-                    app.latest_version = clean_latest
-                    if clean_latest != clean_version and clean_latest not in app.version:
-                        app.update_status = UpdateStatus.UPDATE_AVAILABLE
-                        updates += 1
-                    else:
-                        app.update_status = UpdateStatus.UP_TO_DATE
-            except Exception:
-                pass
-        return updates
+            elif app.name == "python":
+                data = fetch_github_release("python/cpython")
+                if data and data.get("tag_name"):
+                    match = _GENERIC_VER_RE.search(data["tag_name"])
+                    if match:
+                        latest = match.group(1)
+                if not latest:
+                    latest = app.version
+            elif app.name == "git":
+                data = fetch_github_release("git-for-windows/git")
+                if data and data.get("tag_name"):
+                    match = _GIT_VER_RE.search(data["tag_name"])
+                    latest = match.group(1) if match else data["tag_name"].replace("v", "")
+            elif app.name == "pwsh":
+                data = fetch_github_release("PowerShell/PowerShell")
+                if data and data.get("tag_name"):
+                    latest = data["tag_name"].replace("v", "")
+            elif app.name == "dotnet":
+                output = run_command(["winget", "show", "Microsoft.DotNet.SDK.9", "--accept-source-agreements"])
+                if output:
+                    match = _WINGET_VER_RE.search(output)
+                    if match:
+                        latest = match.group(1)
+
+            if latest:
+                clean_version = _strip_leading_nondigits(app.version)
+                clean_latest = _strip_leading_nondigits(latest)
+                app.latest_version = clean_latest
+                if clean_latest != clean_version and clean_latest not in app.version:
+                    app.update_status = _UPDATE_AVAILABLE
+                    return 1
+                app.update_status = _UP_TO_DATE
+        except Exception:
+            pass
+        return 0
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1225,7 +1808,6 @@ class UpdateExecutor:
                 progress.update(task, description=f"📦 Updating {app.name}...")
 
                 if dry_run:
-                    time.sleep(0.3)
                     success_count += 1
                     console.print(
                         f"[yellow]🔍 DRY RUN[/yellow]: {app.name} → {app.latest_version}"
@@ -1365,26 +1947,27 @@ class SystemUpdateApp:
         task_scan = progress.add_task("🔍 Scanning system...", total=total_sources)
 
         all_apps = []
-        max_workers = config.settings["performance"]["max_workers"]
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_source = {
-                executor.submit(func): name
-                for name, func in scanners.items()
-                if config.settings["sources"].get(name.lower(), True)
-            }
+        enabled = [
+            name
+            for name in scanners
+            if config.settings["sources"].get(name.lower(), True)
+        ]
+        scan_started = datetime.now()
+        futures = submit_all(scanners[name] for name in enabled)
+        future_to_source = dict(zip(futures, enabled))
 
-            for future in as_completed(future_to_source):
-                source_name = future_to_source[future]
-                try:
-                    apps = future.result()
-                    all_apps.extend(apps)
-                    progress.console.print(
-                        f"  [green]✓[/green] Found {len(apps)} in {source_name}"
-                    )
-                except Exception as e:
-                    progress.console.print(f"  [red]✗[/red] {source_name} failed: {e}")
-                progress.advance(task_scan)
+        for future in as_completed(future_to_source):
+            source_name = future_to_source[future]
+            try:
+                apps = future.result()
+                finalize_scan_times(apps, scan_started)
+                all_apps.extend(apps)
+                progress.console.print(
+                    f"  [green]✓[/green] Found {len(apps)} in {source_name}"
+                )
+            except Exception as e:
+                progress.console.print(f"  [red]✗[/red] {source_name} failed: {e}")
+            progress.advance(task_scan)
 
         return all_apps
 
@@ -1398,13 +1981,19 @@ class SystemUpdateApp:
 
         try:
             if format_type == "json":
-                data = {
+                header = {
                     "scan_time": datetime.now().isoformat(),
                     "total_apps": len(apps),
-                    "apps": [app.to_dict() for app in apps],
                 }
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
+                with open(output_file, "wb", buffering=1 << 20) as f:
+                    # Stream one app at a time instead of building the whole list
+                    f.write(_json_dumps(header)[:-1])
+                    f.write(b',"apps":[')
+                    for i, app in enumerate(apps):
+                        if i:
+                            f.write(b",")
+                        f.write(_json_dumps(app.to_dict()))
+                    f.write(b"]}")
 
             elif format_type == "csv":
                 with open(output_file, "w", newline="", encoding="utf-8") as f:
@@ -1458,8 +2047,12 @@ class SystemUpdateApp:
                 apps = self.scan_system(progress, args.source)
 
                 # Deduplicate
-                unique_apps = list({f"{a.name}|{a.version}": a for a in apps}.values())
-                apps = sorted(unique_apps, key=lambda x: (x.source, x.name))
+                unique_apps: Dict[Tuple[str, str], AppInfo] = {}
+                for app in apps:
+                    unique_apps[(app.name, app.version)] = app
+                apps = sorted(
+                    unique_apps.values(), key=operator.attrgetter("source", "name")
+                )
 
                 # Check updates
                 task_check = progress.add_task("🔍 Checking updates...", total=100)
@@ -1487,7 +2080,7 @@ class SystemUpdateApp:
             return
 
         # Display results
-        updates = [a for a in apps if a.update_status == UpdateStatus.UPDATE_AVAILABLE]
+        updates = [a for a in apps if a.update_status is _UPDATE_AVAILABLE]
         vulnerable = [a for a in apps if a.update_status == UpdateStatus.VULNERABLE]
 
         # Show security alerts first
@@ -1530,8 +2123,8 @@ class SystemUpdateApp:
         candidates = [
             app
             for app in apps
-            if app.name.lower() == target_name
-            and (not target_source or app.source.lower() == target_source)
+            if app._name_ci == target_name
+            and (not target_source or app._source_ci == target_source)
         ]
 
         if not candidates:
@@ -1588,6 +2181,9 @@ Examples:
         "--no-cache", action="store_true", help="Force fresh scan (ignore cache)"
     )
     parser.add_argument("--clear-cache", action="store_true", help="Clear scan cache")
+    parser.add_argument(
+        "--verbose", action="store_true", help="Write debug details to the log file"
+    )
 
     # Export options
     parser.add_argument(
@@ -1604,6 +2200,8 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.verbose:
+        enable_verbose_logging()
 
     # Create and run application
     app = SystemUpdateApp()